@@ -12,37 +12,57 @@ Restructured into modular components:
 - config.py: Configuration settings
 - tools/: Memory and task management tools
 - agents/: Specialized and root orchestrator agents
+- services/: Session storage services
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 
 # ============================================================
 # LOGGING CONFIGURATION
 # ============================================================
 
 # Clean up any previous logs
-for log_file in ["logger.log", "web.log", "tunnel.log"]:
-    if os.path.exists(log_file):
-        os.remove(log_file)
-        print(f"🧹 Cleaned up {log_file}")
-
-# Configure logging with DEBUG log level
-logging.basicConfig(
-    filename="logger.log",
-    level=logging.DEBUG,
-    format="%(asctime)s - %(name)s - %(filename)s:%(lineno)s - %(levelname)s: %(message)s",
+for log_file in ("logger.log", "web.log", "tunnel.log"):
+    try:
+        os.unlink(log_file)
+    except FileNotFoundError:
+        pass
+
+# The ADK CLI sets the level from --log_level/--verbose; only override it for
+# AI_THERAPIST_DEBUG, and default to INFO when nothing has configured logging yet
+root_logger = logging.getLogger()
+if os.getenv("AI_THERAPIST_DEBUG"):
+    root_logger.setLevel(logging.DEBUG)
+elif not root_logger.handlers:
+    root_logger.setLevel(logging.INFO)
+file_handler = logging.FileHandler("logger.log")
+file_formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(filename)s:%(lineno)s - %(levelname)s: %(message)s"
 )
+file_handler.setFormatter(file_formatter)
 
 # Also log to console
 console_handler = logging.StreamHandler()
 console_handler.setLevel(logging.INFO)
 console_formatter = logging.Formatter("%(levelname)s: %(message)s")
 console_handler.setFormatter(console_formatter)
-logging.getLogger().addHandler(console_handler)
 
-print("✅ Logging configured - logs will be written to logger.log")
-logging.info("Personal Psychologist Agent logging initialized")
+# Hand records to a background listener so callers only enqueue;
+# the listener thread owns the file and console handlers
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue, file_handler, console_handler, respect_handler_level=True
+)
+# Added alongside any handlers the ADK CLI installed before importing this module
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logging.info("Personal Psychologist Agent logging initialized - logs will be written to logger.log")
 
 from google.adk.apps import App, ResumabilityConfig
 from google.adk.sessions import InMemorySessionService
@@ -53,7 +73,14 @@ from .agents.root_agent import root_agent
 # SERVICE CONFIGURATION
 # ============================================================
 
-session_service = InMemorySessionService()
+# Session service for programmatic Runner use; the ADK CLI builds its own
+# from --session_service_uri. Share sessions through Redis when REDIS_URL is set
+redis_url = os.getenv("REDIS_URL")
+if redis_url:
+    from .services import RedisSessionService
+    session_service = RedisSessionService(url=redis_url)
+else:
+    session_service = InMemorySessionService()
 
 
 # ============================================================
@@ -72,7 +99,7 @@ app = App(
 # ============================================================
 
 if __name__ == "__main__":
-    logging.info("Starting Personal Psychologist Agent initialization")    
-    logging.info(f"Agent initialized with root: {root_agent.name}")
-    logging.debug(f"Session service type: {type(session_service).__name__}")
-    logging.debug(f"App name: {app.name}")
+    logging.info("Starting Personal Psychologist Agent initialization")
+    logging.info("Agent initialized with root: %s", root_agent.name)
+    logging.debug("Session service type: %s", type(session_service).__name__)
+    logging.debug("App name: %s", app.name)
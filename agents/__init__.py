@@ -6,6 +6,7 @@ from .specialized_agents import therapeutic_agent, task_agent
 from .sequential_agent import journal_analysis_flow
 from .goal_refinement_agent import goal_refinement_agent
 from .search_agent import search_agent
+from .parallel_agent import multi_intent_flow
 from .root_agent import root_agent
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     'journal_analysis_flow',
     'goal_refinement_agent',
     'search_agent',
+    'multi_intent_flow',
     'root_agent'
 ]
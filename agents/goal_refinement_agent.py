@@ -4,8 +4,7 @@ Quickly creates goals with routines using minimal questions
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from ..config import retry_config
+from ..config import gemini_flash_2
 from ..tools.goal_tools import (
     create_goal_with_routine,
     approve_goal,
@@ -21,10 +20,7 @@ from ..tools.datetime_tools import get_current_datetime
 
 goal_refinement_agent = LlmAgent(
     name="goal_refinement",
-    model=Gemini(
-        model="gemini-2.0-flash",
-        retry_options=retry_config
-    ),
+    model=gemini_flash_2,
     description="Quickly creates actionable goals with routines, shows and manages user goals.",
     instruction="""You help users turn vague desires into concrete goals with routines. Be FAST and ACTION-ORIENTED.
 
@@ -0,0 +1,23 @@
+"""
+Parallel agent for Personal Assistant
+Handles messages that need emotional support and task management at once
+"""
+
+from google.adk.agents import ParallelAgent
+from .specialized_agents import build_therapeutic_agent, build_task_agent
+
+
+# ============================================================
+# MULTI-INTENT SUPPORT (Parallel Flow)
+# Purpose: "I'm overwhelmed AND remind me to call mom tomorrow"
+# Both specialists run concurrently, so the turn costs max(L1, L2) not L1 + L2
+# ============================================================
+
+multi_intent_flow = ParallelAgent(
+    name="multi_intent_support",
+    description="Runs emotional support and task management concurrently for messages that need both.",
+    sub_agents=[
+        build_therapeutic_agent(name="parallel_therapeutic_support"),
+        build_task_agent(name="parallel_task_manager")
+    ]
+)
@@ -6,12 +6,13 @@ Coordinates between specialized agents based on user intent
 import logging
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from ..config import retry_config
+from ..config import gemini_flash_lite
 from ..tools.memory_tools import load_memory, save_to_memory
+from ..tools.state_migration import migrate_flat_lists
 from .specialized_agents import therapeutic_agent, task_agent
 from .goal_refinement_agent import goal_refinement_agent
 from .search_agent import search_agent
+from .parallel_agent import multi_intent_flow
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
@@ -24,10 +25,7 @@ logger.info("Initializing root orchestrator agent")
 
 root_agent = LlmAgent(
     name="personal_assistant",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=gemini_flash_lite,
     description="Your personal AI assistant that helps with emotional wellbeing, task management, goal setting, and daily support.",
     instruction="""You're a warm, supportive personal assistant designed to help users with their daily life, emotional wellbeing, and personal growth.
 
@@ -99,7 +97,14 @@ Route requests to the right specialist.
    - Note: search_specialist will find and summarize evidence-based information
    - DO NOT use for general coping advice (therapeutic_support handles that)
 
-5. **Personal Info** (you handle):
+5. **Mixed Requests** (emotional support AND a concrete task in one message):
+   - "I'm overwhelmed and remind me to call mom tomorrow"
+   - "Work was rough today, add a task to update my resume"
+   - **→ Delegate to multi_intent_support**
+   - Note: emotional support and task handling run at the same time
+   - Only use when BOTH are clearly present; otherwise pick the single matching specialist
+
+6. **Personal Info** (you handle):
    - User shares name/interests → use save_to_memory
    - User asks what you know about them → use load_memory
    - General conversation that doesn't need specialist help
@@ -112,5 +117,6 @@ Route requests to the right specialist.
 - After any delegation completes, briefly acknowledge what was accomplished
 - Don't overthink it - delegate quickly and confidently""",
     tools=[load_memory, save_to_memory],
-    sub_agents=[therapeutic_agent, task_agent, goal_refinement_agent, search_agent]
+    sub_agents=[therapeutic_agent, task_agent, goal_refinement_agent, search_agent, multi_intent_flow],
+    before_agent_callback=migrate_flat_lists
 )
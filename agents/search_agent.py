@@ -4,8 +4,7 @@ Handles web searches for information, research, and psychoeducation
 """
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from ..config import retry_config
+from ..config import gemini_flash_lite
 from google.adk.tools import google_search
 
 
@@ -15,10 +14,7 @@ from google.adk.tools import google_search
 
 search_agent = LlmAgent(
     name="search_specialist",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
+    model=gemini_flash_lite,
     description="Performs web searches for information, research, evidence-based content, and answers to factual questions.",
     instruction="""You're a search specialist that helps users find accurate, evidence-based information from the web.
 
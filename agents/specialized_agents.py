@@ -6,9 +6,8 @@ Therapeutic support and task management agents
 import logging
 
 from google.adk.agents import LlmAgent
-from google.adk.models.google_llm import Gemini
-from ..config import retry_config
-from ..tools.memory_tools import load_memory, save_therapeutic_pattern
+from ..config import gemini_flash_lite
+from ..tools.memory_tools import preload_memory_snapshot, save_therapeutic_pattern, get_pattern
 from ..tools.task_tools import (
     create_task, 
     get_tasks, 
@@ -25,26 +24,30 @@ logger = logging.getLogger(__name__)
 # THERAPEUTIC SUPPORT AGENT
 # ============================================================
 
-logger.info("Initializing therapeutic support agent")
+def build_therapeutic_agent(name: str = "therapeutic_support") -> LlmAgent:
+    """Build a therapeutic support agent.
+
+    An agent can only have one parent, so every agent tree that runs it
+    needs its own instance.
+    """
+    return LlmAgent(
+        name=name,
+        model=gemini_flash_lite,
+        description="Provides empathetic emotional support and coping strategies with memory learning.",
+        instruction="""You're a supportive friend who listens and helps people feel better. Be brief, warm, and real.
 
-therapeutic_agent = LlmAgent(
-    name="therapeutic_support",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    description="Provides empathetic emotional support and coping strategies with memory learning.",
-    instruction="""You're a supportive friend who listens and helps people feel better. Be brief, warm, and real.
+**MEMORY (already loaded - check what's worked before):**
+{temp:memory_snapshot}
 
 **SIMPLE WORKFLOW:**
-1. Call load_memory() to check what's worked before
-2. Immediately respond warmly with support (2-3 sentences)
-3. If user gives feedback later, save it with save_therapeutic_pattern()
+1. Immediately respond warmly with support (2-3 sentences)
+2. If user gives feedback later, save it with save_therapeutic_pattern()
 
 **How to respond:**
 - Acknowledge their feeling + offer ONE concrete coping technique
 - Keep it short and conversational
 - Use what worked before if memory shows it
+- To check one emotion's history directly → get_pattern(trigger="the emotion") (latest_helpful is the most recent thing that worked)
 - Talk like a caring friend, not a clinical therapist
 
 **Coping techniques to suggest:**
@@ -61,20 +64,24 @@ therapeutic_agent = LlmAgent(
 **Quick examples:**
 
 User: "I'm really stressed about my presentation tomorrow"
-You: [load_memory()] 
-"That's totally normal! Try this right now - breathe in for 4, hold for 7, out for 8. Do it three times. Also, a quick rehearsal before bed helps your brain feel more prepared."
+You: "That's totally normal! Try this right now - breathe in for 4, hold for 7, out for 8. Do it three times. Also, a quick rehearsal before bed helps your brain feel more prepared."
 
 User: "I'm so overwhelmed"
-You: [load_memory()]
-"I get it. Let's break this down - what's ONE thing you can handle right now? Just pick the smallest task and do that. Everything else can wait 20 minutes."
+You: "I get it. Let's break this down - what's ONE thing you can handle right now? Just pick the smallest task and do that. Everything else can wait 20 minutes."
 
 User: "The breathing helped!"
 You: [save_therapeutic_pattern(trigger="stressed", response="4-7-8 breathing", helpful=True)]
 "Awesome! Your brain is learning what works for you. Use that whenever stress hits."
 
-**Remember:** Load memory → Respond immediately → Save feedback if given. Don't get stuck after loading memory!""",
-    tools=[load_memory, save_therapeutic_pattern]
-)
+**Remember:** Respond immediately → Save feedback if given.""",
+        tools=[save_therapeutic_pattern, get_pattern],
+        before_agent_callback=preload_memory_snapshot
+    )
+
+
+logger.info("Initializing therapeutic support agent")
+
+therapeutic_agent = build_therapeutic_agent()
 
 logger.info("Therapeutic support agent initialized")
 
@@ -83,16 +90,13 @@ logger.info("Therapeutic support agent initialized")
 # TASK MANAGEMENT AGENT
 # ============================================================
 
-logger.info("Initializing task management agent")
-
-task_agent = LlmAgent(
-    name="task_manager",
-    model=Gemini(
-        model="gemini-2.5-flash-lite",
-        retry_options=retry_config
-    ),
-    description="Manages concrete tasks, reminders, and scheduling with automatic date/time awareness.",
-    instruction="""You manage tasks and reminders efficiently. Complete ALL requests in one interaction.
+def build_task_agent(name: str = "task_manager") -> LlmAgent:
+    """Build a task management agent."""
+    return LlmAgent(
+        name=name,
+        model=gemini_flash_lite,
+        description="Manages concrete tasks, reminders, and scheduling with automatic date/time awareness.",
+        instruction="""You manage tasks and reminders efficiently. Complete ALL requests in one interaction.
 
 **YOUR ONLY DATETIME TOOL: get_current_datetime()**
 Call it ONCE at start, then calculate dates and create everything.
@@ -140,5 +144,10 @@ Step 5: Respond
 - Create ALL items before responding
 - Don't wait between steps - do them all
 - Your response comes AFTER all tools are used""",
-    tools=[get_current_datetime, create_task, get_tasks, schedule_reminder, get_reminders, get_all_items]
-)
+        tools=[get_current_datetime, create_task, get_tasks, schedule_reminder, get_reminders, get_all_items]
+    )
+
+
+logger.info("Initializing task management agent")
+
+task_agent = build_task_agent()
@@ -2,15 +2,34 @@
 Configuration settings for Personal Psychologist AI Agent
 """
 
+from google.adk.models.google_llm import Gemini
 from google.genai import types
 
 # ============================================================
 # RETRY CONFIGURATION
 # ============================================================
 
+# Fewer attempts so agents sharing one API key don't pile retries onto a 429/503.
+# google-genai already adds uniform(0, 1s) jitter to each backoff by default.
 retry_config = types.HttpRetryOptions(
-    attempts=5,
+    attempts=3,
     exp_base=2,
-    initial_delay=1,
+    initial_delay=2,
     http_status_codes=[429, 500, 503, 504]
 )
+
+
+# ============================================================
+# MODEL CONFIGURATION
+# ============================================================
+
+# Shared across agents so they reuse one client and connection pool
+gemini_flash_lite = Gemini(
+    model="gemini-2.5-flash-lite",
+    retry_options=retry_config
+)
+
+gemini_flash_2 = Gemini(
+    model="gemini-2.0-flash",
+    retry_options=retry_config
+)
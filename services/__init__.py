@@ -0,0 +1,22 @@
+"""
+Services package for Personal Psychologist AI Agent
+
+Importing this package registers the redis:// and rediss:// session service
+schemes with ADK, so `--session_service_uri redis://...` selects
+RedisSessionService. adk run imports it from the agent directory on its own.
+"""
+
+from google.adk.cli.service_registry import get_service_registry
+
+from .redis_session_service import RedisSessionService
+
+
+def _redis_session_factory(uri: str, **kwargs) -> RedisSessionService:
+    # kwargs carries CLI extras such as agents_dir, which Redis doesn't need
+    return RedisSessionService(url=uri)
+
+
+for _scheme in ("redis", "rediss"):
+    get_service_registry().register_session_service(_scheme, _redis_session_factory)
+
+__all__ = ['RedisSessionService']
@@ -0,0 +1,292 @@
+"""
+Redis-backed session service for Personal Psychologist AI Agent
+Keeps sessions outside the process so multiple workers can share them
+"""
+
+import json
+import logging
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from google.adk.errors.already_exists_error import AlreadyExistsError
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, Session, State
+from google.adk.sessions.base_session_service import GetSessionConfig, ListSessionsResponse
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# Rolling expiry for sessions, refreshed on every write
+SESSION_TTL_SECONDS = 86400 * 7
+
+# Same wording as DatabaseSessionService
+_STALE_SESSION_ERROR_MESSAGE = (
+    "The session has been modified in storage since it was loaded. "
+    "Please reload the session before appending more events."
+)
+
+
+class RedisSessionService(BaseSessionService):
+    """Session service that stores each session in Redis.
+
+    The session itself (session-scoped state, no events) is a JSON blob;
+    its events are appended one by one to a Redis list, so a new event
+    costs O(1) instead of rewriting the whole history. 'app:' and 'user:'
+    state is stored once per app/user and merged in on read, the same way
+    InMemorySessionService shares it across sessions.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = SESSION_TTL_SECONDS):
+        # Optional dependency - only needed when REDIS_URL is configured
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._watch_error = redis.WatchError
+        self._ttl_seconds = ttl_seconds
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None
+    ) -> Session:
+        session_id = session_id.strip() if session_id and session_id.strip() else str(uuid.uuid4())
+        app_state, user_state, session_state = _split_state(state or {})
+
+        session = Session(
+            app_name=app_name,
+            user_id=user_id,
+            id=session_id,
+            state=session_state,
+            last_update_time=time.time()
+        )
+
+        # SET NX so an existing session is never overwritten
+        if not await self._save(session, only_if_new=True):
+            raise AlreadyExistsError(f"Session with id {session_id} already exists.")
+
+        await self._write_shared_state(app_name, user_id, app_state, user_state)
+        logger.info("Created session %s for user %s", session_id, user_id)
+        return await self._merge_shared_state(session)
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None
+    ) -> Optional[Session]:
+        # Only the requested tail of the event list is fetched
+        start = -config.num_recent_events if config and config.num_recent_events else 0
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(_session_key(app_name, user_id, session_id))
+            pipe.lrange(_events_key(app_name, user_id, session_id), start, -1)
+            raw, raw_events = await pipe.execute()
+
+        if raw is None:
+            return None
+
+        session = Session.model_validate_json(raw)
+        session.events = [Event.model_validate_json(e) for e in raw_events]
+
+        if config and config.after_timestamp:
+            session.events = [e for e in session.events if e.timestamp >= config.after_timestamp]
+
+        return await self._merge_shared_state(session)
+
+    async def list_sessions(
+        self,
+        *,
+        app_name: str,
+        user_id: Optional[str] = None
+    ) -> ListSessionsResponse:
+        if user_id is not None:
+            index_keys = [_index_key(app_name, user_id)]
+        else:
+            index_keys = [key async for key in self._redis.scan_iter(match=_index_key(app_name, "*"))]
+
+        sessions = []
+        for index_key in index_keys:
+            owner = index_key[len(_index_key(app_name, "")):]
+            sessions.extend(await self._list_user_sessions(app_name, owner, index_key))
+
+        # Oldest first, like the built-in session services
+        sessions.sort(key=lambda s: (s.last_update_time, s.user_id, s.id))
+        return ListSessionsResponse(sessions=sessions)
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(_session_key(app_name, user_id, session_id))
+            pipe.delete(_events_key(app_name, user_id, session_id))
+            pipe.srem(_index_key(app_name, user_id), session_id)
+            await pipe.execute()
+        logger.info("Deleted session %s for user %s", session_id, user_id)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        if event.partial:
+            return event
+
+        app_delta, user_delta = {}, {}
+        if event.actions and event.actions.state_delta:
+            app_delta, user_delta, _ = _split_state(event.actions.state_delta)
+
+        session_key = _session_key(session.app_name, session.user_id, session.id)
+
+        # Optimistic concurrency: another worker writing this session between
+        # the check and EXEC aborts the transaction with WatchError
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await pipe.watch(session_key)
+            raw = await pipe.get(session_key)
+            if raw is not None and Session.model_validate_json(raw).last_update_time > session.last_update_time:
+                raise ValueError(_STALE_SESSION_ERROR_MESSAGE)
+
+            event = await super().append_event(session=session, event=event)
+            session.last_update_time = event.timestamp
+
+            pipe.multi()
+            self._queue_shared_state(pipe, session.app_name, session.user_id, app_delta, user_delta)
+            self._queue_save(pipe, session, new_event=event)
+            try:
+                await pipe.execute()
+            except self._watch_error:
+                raise ValueError(_STALE_SESSION_ERROR_MESSAGE) from None
+
+        return event
+
+    async def _list_user_sessions(self, app_name: str, user_id: str, index_key: str) -> List[Session]:
+        """Load one user's sessions (without events), pruning expired IDs from the index."""
+        session_ids = sorted(await self._redis.smembers(index_key))
+        if not session_ids:
+            return []
+
+        raws = await self._redis.mget([_session_key(app_name, user_id, sid) for sid in session_ids])
+
+        sessions = []
+        expired = []
+        for session_id, raw in zip(session_ids, raws):
+            if raw is None:
+                expired.append(session_id)
+                continue
+            sessions.append(await self._merge_shared_state(Session.model_validate_json(raw)))
+
+        if expired:
+            await self._redis.srem(index_key, *expired)
+
+        return sessions
+
+    async def _save(self, session: Session, only_if_new: bool = False) -> bool:
+        """Write the session in its own transaction.
+
+        Returns False if only_if_new was set and the session already existed.
+        """
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._queue_save(pipe, session, only_if_new=only_if_new)
+            results = await pipe.execute()
+        return bool(results[0])
+
+    def _queue_save(
+        self,
+        pipe,
+        session: Session,
+        new_event: Optional[Event] = None,
+        only_if_new: bool = False
+    ) -> None:
+        """Queue writes for the session blob (session-scoped state, no events),
+        a new event on the event list, and TTL refreshes. The blob SET comes first.
+        """
+        _, _, session_state = _split_state(session.state)
+        blob = session.model_copy(update={"state": session_state, "events": []}).model_dump_json()
+        events_key = _events_key(session.app_name, session.user_id, session.id)
+        index_key = _index_key(session.app_name, session.user_id)
+
+        pipe.set(_session_key(session.app_name, session.user_id, session.id), blob, ex=self._ttl_seconds, nx=only_if_new)
+        if new_event is not None:
+            pipe.rpush(events_key, new_event.model_dump_json())
+            pipe.expire(events_key, self._ttl_seconds)
+        pipe.sadd(index_key, session.id)
+        pipe.expire(index_key, self._ttl_seconds)
+
+    async def _write_shared_state(
+        self,
+        app_name: str,
+        user_id: str,
+        app_state: Dict[str, Any],
+        user_state: Dict[str, Any]
+    ) -> None:
+        if not app_state and not user_state:
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            self._queue_shared_state(pipe, app_name, user_id, app_state, user_state)
+            await pipe.execute()
+
+    def _queue_shared_state(
+        self,
+        pipe,
+        app_name: str,
+        user_id: str,
+        app_state: Dict[str, Any],
+        user_state: Dict[str, Any]
+    ) -> None:
+        if app_state:
+            pipe.hset(_app_state_key(app_name), mapping=_encode(app_state))
+        if user_state:
+            user_key = _user_state_key(app_name, user_id)
+            pipe.hset(user_key, mapping=_encode(user_state))
+            pipe.expire(user_key, self._ttl_seconds)
+
+    async def _merge_shared_state(self, session: Session) -> Session:
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(_app_state_key(session.app_name))
+            pipe.hgetall(_user_state_key(session.app_name, session.user_id))
+            app_state, user_state = await pipe.execute()
+
+        for key, value in app_state.items():
+            session.state[State.APP_PREFIX + key] = json.loads(value)
+        for key, value in user_state.items():
+            session.state[State.USER_PREFIX + key] = json.loads(value)
+        return session
+
+
+def _session_key(app_name: str, user_id: str, session_id: str) -> str:
+    return f"session:{app_name}:{user_id}:{session_id}"
+
+
+def _events_key(app_name: str, user_id: str, session_id: str) -> str:
+    return f"events:{app_name}:{user_id}:{session_id}"
+
+
+def _index_key(app_name: str, user_id: str) -> str:
+    return f"sessions:{app_name}:{user_id}"
+
+
+def _app_state_key(app_name: str) -> str:
+    return f"app_state:{app_name}"
+
+
+def _user_state_key(app_name: str, user_id: str) -> str:
+    return f"user_state:{app_name}:{user_id}"
+
+
+def _split_state(state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Split state into (app, user, session) parts, dropping 'temp:' keys."""
+    app_state, user_state, session_state = {}, {}, {}
+
+    for key, value in state.items():
+        if key.startswith(State.APP_PREFIX):
+            app_state[key[len(State.APP_PREFIX):]] = value
+        elif key.startswith(State.USER_PREFIX):
+            user_state[key[len(State.USER_PREFIX):]] = value
+        elif not key.startswith(State.TEMP_PREFIX):
+            session_state[key] = value
+
+    return app_state, user_state, session_state
+
+
+def _encode(state: Dict[str, Any]) -> Dict[str, str]:
+    return {key: json.dumps(value) for key, value in state.items()}
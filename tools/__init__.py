@@ -2,7 +2,7 @@
 Tools package for Personal Psychologist AI Agent
 """
 
-from .memory_tools import load_memory, save_to_memory, save_therapeutic_pattern
+from .memory_tools import load_memory, save_to_memory, save_therapeutic_pattern, get_pattern
 from .task_tools import create_task, get_tasks, schedule_reminder, get_reminders, get_all_items
 from .datetime_tools import get_current_datetime
 from .goal_tools import (
@@ -17,6 +17,7 @@ __all__ = [
     'load_memory',
     'save_to_memory', 
     'save_therapeutic_pattern',
+    'get_pattern',
     'create_task',
     'get_tasks',
     'schedule_reminder',
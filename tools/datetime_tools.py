@@ -5,6 +5,7 @@ Provides current date and time information for scheduling
 
 from datetime import datetime
 from google.adk.tools.tool_context import ToolContext
+from .tool_cache import now_iso
 
 
 def get_current_datetime(tool_context: ToolContext) -> str:
@@ -14,5 +15,6 @@ def get_current_datetime(tool_context: ToolContext) -> str:
         Current date (YYYY-MM-DD) and time (HH:MM) in simple format.
         Use this to calculate relative dates like 'tomorrow' or 'next Friday'.
     """
-    now = datetime.now()
-    return f"Date: {now.strftime('%Y-%m-%d')} ({now.strftime('%A')}), Time: {now.strftime('%H:%M')}"
+    # Same timestamp for every call in the invocation, matching the items it creates
+    now = datetime.fromisoformat(now_iso(tool_context))
+    return f"Date: {now:%Y-%m-%d} ({now:%A}), Time: {now:%H:%M}"
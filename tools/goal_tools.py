@@ -3,9 +3,89 @@ Goal and routine management tools for Personal Assistant
 Handles creating, saving, fetching, and displaying goals with routines
 """
 
-from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Optional
 from google.adk.tools.tool_context import ToolContext
+from .tool_cache import (
+    memoize_per_invocation,
+    clear_tool_cache,
+    bump_version,
+    get_cached_listing,
+    cache_listing,
+    next_id,
+    now_iso
+)
+
+
+# ============================================================
+# OUTPUT TEMPLATES
+# Filled with str.format_map from the goal dict
+# ============================================================
+
+_GOAL_CREATED_CARD = """
+📋 Goal Created (ID: {id}) - Pending Your Approval
+
+**{title}**
+
+🎯 Goal: {description}
+
+📅 Routine:
+{routine}
+
+⏰ Frequency: {frequency}
+⏳ Duration: {duration}
+🚀 Start Date: {start_date}
+
+Type 'approve' to activate this goal, or tell me what you'd like to change.
+"""
+
+_GOAL_DETAIL_CARD = """
+{_status_emoji} Goal #{id}: **{title}** ({_status_detail})
+
+🎯 Goal: {description}
+
+📅 Routine:
+{routine}
+
+⏰ Frequency: {frequency}
+⏳ Duration: {duration}
+🚀 Start Date: {start_date}
+📆 Created: {created_date}
+"""
+
+# Reply for update_goal_status, keyed by the new status
+_STATUS_TEMPLATES = {
+    'completed': "🎉 Congratulations! Goal '{title}' marked as completed!",
+    'paused': "⏸️ Goal '{title}' paused. You can resume it anytime.",
+    'cancelled': "🚫 Goal '{title}' cancelled.",
+    'active': "✅ Goal '{title}' is now active!"
+}
+
+# Display fields stored on each goal when 'approved' changes, keyed by its value.
+# _status_text is the short form for list_goals, _status_detail the get_goal form.
+_STATUS_DISPLAY = {
+    True: {"_status_emoji": "✅", "_status_text": "Active", "_status_detail": "Active"},
+    False: {"_status_emoji": "⏳", "_status_text": "Pending", "_status_detail": "Pending Approval"}
+}
+
+
+def _goal_key(user_id: str, goal_id: int) -> str:
+    return f"{user_id}:{goal_id}"
+
+
+def _goal_index(tool_context: ToolContext) -> Dict[str, int]:
+    """Map of "user_id:goal_id" to the goal's position in the user's goal list.
+    
+    Storing positions keeps the list the single copy of each goal.
+    """
+    return tool_context.state.get('goal_index', {})
+
+
+def _find_goal(tool_context: ToolContext, goal_id: int) -> Optional[Dict[str, Any]]:
+    """Look up one of the current user's goals by ID in O(1)."""
+    position = _goal_index(tool_context).get(_goal_key(tool_context.user_id, goal_id))
+    if position is None:
+        return None
+    return tool_context.state['goals'][tool_context.user_id][position]
 
 
 def create_goal_with_routine(
@@ -32,10 +112,10 @@ def create_goal_with_routine(
     """
     user_id = tool_context.user_id
     
-    if 'goals' not in tool_context.state:
-        tool_context.state['goals'] = []
-    
-    goal_id = len(tool_context.state['goals']) + 1
+    # Goals are partitioned per user: state['goals'][user_id] -> list
+    goals = tool_context.state.setdefault('goals', {})
+    user_goals = goals.setdefault(user_id, [])
+    goal_id = next_id(tool_context, 'next_goal_id')
     
     goal = {
         "id": goal_id,
@@ -47,34 +127,21 @@ def create_goal_with_routine(
         "duration": duration,
         "start_date": start_date,
         "status": "pending_approval",
-        "created_at": datetime.now().isoformat(),
-        "approved": False
+        "created_at": now_iso(tool_context),
+        "approved": False,
+        **_STATUS_DISPLAY[False]
     }
     
     # Store temporarily for approval
-    goals = tool_context.state['goals']
-    goals.append(goal)
+    goal_index = _goal_index(tool_context)
+    goal_index[_goal_key(user_id, goal_id)] = len(user_goals)
+    user_goals.append(goal)
     tool_context.state['goals'] = goals
+    tool_context.state['goal_index'] = goal_index
+    bump_version(tool_context, 'goals')
+    clear_tool_cache(tool_context)
     
-    # Format output
-    result = f"""
-📋 Goal Created (ID: {goal_id}) - Pending Your Approval
-
-**{title}**
-
-🎯 Goal: {goal_description}
-
-📅 Routine:
-{routine}
-
-⏰ Frequency: {frequency}
-⏳ Duration: {duration}
-🚀 Start Date: {start_date}
-
-Type 'approve' to activate this goal, or tell me what you'd like to change.
-"""
-    
-    return result
+    return _GOAL_CREATED_CARD.format_map(goal)
 
 
 def approve_goal(goal_id: int, tool_context: ToolContext) -> str:
@@ -86,31 +153,29 @@ def approve_goal(goal_id: int, tool_context: ToolContext) -> str:
     Returns:
         Confirmation message
     """
-    user_id = tool_context.user_id
-    
-    if 'goals' not in tool_context.state:
+    goals = tool_context.state.get('goals')
+    if goals is None:
         return "❌ No goals found to approve."
     
-    goals = tool_context.state['goals']
-    goal_found = False
-    
-    for goal in goals:
-        if goal.get('id') == goal_id and goal.get('user_id') == user_id:
-            goal['approved'] = True
-            goal['status'] = 'active'
-            goal['approved_at'] = datetime.now().isoformat()
-            goal_found = True
-            break
+    goal = _find_goal(tool_context, goal_id)
     
-    if not goal_found:
+    if goal is None:
         return f"❌ Goal ID {goal_id} not found."
     
+    goal['approved'] = True
+    goal.update(_STATUS_DISPLAY[True])
+    goal['status'] = 'active'
+    goal['approved_at'] = now_iso(tool_context)
+    
     # Reassign to trigger state change
     tool_context.state['goals'] = goals
+    bump_version(tool_context, 'goals')
+    clear_tool_cache(tool_context)
     
     return f"✅ Goal '{goal['title']}' is now active! Let's make it happen! 🎉"
 
 
+@memoize_per_invocation
 def get_goal(goal_id: int, tool_context: ToolContext) -> str:
     """Retrieve and display a specific goal by ID.
     
@@ -120,34 +185,21 @@ def get_goal(goal_id: int, tool_context: ToolContext) -> str:
     Returns:
         Formatted goal details
     """
-    user_id = tool_context.user_id
-    
     if 'goals' not in tool_context.state:
         return "❌ No goals found."
     
-    for goal in tool_context.state['goals']:
-        if goal.get('id') == goal_id and goal.get('user_id') == user_id:
-            status_emoji = "✅" if goal.get('approved') else "⏳"
-            status_text = "Active" if goal.get('approved') else "Pending Approval"
-            
-            result = f"""
-{status_emoji} Goal #{goal_id}: **{goal['title']}** ({status_text})
-
-🎯 Goal: {goal['description']}
-
-📅 Routine:
-{goal['routine']}
-
-⏰ Frequency: {goal['frequency']}
-⏳ Duration: {goal['duration']}
-🚀 Start Date: {goal['start_date']}
-📆 Created: {goal['created_at'][:10]}
-"""
-            return result
+    goal = _find_goal(tool_context, goal_id)
+    
+    if goal is None:
+        return f"❌ Goal ID {goal_id} not found."
     
-    return f"❌ Goal ID {goal_id} not found."
+    return _GOAL_DETAIL_CARD.format_map({
+        **goal,
+        "created_date": goal['created_at'][:10]
+    })
 
 
+@memoize_per_invocation
 def list_goals(tool_context: ToolContext) -> str:
     """List all goals for the current user.
     
@@ -156,27 +208,25 @@ def list_goals(tool_context: ToolContext) -> str:
     """
     user_id = tool_context.user_id
     
-    if 'goals' not in tool_context.state:
-        return "You don't have any goals yet. Let's create one!"
-    
-    user_goals = [g for g in tool_context.state['goals'] if g.get('user_id') == user_id]
+    user_goals = tool_context.state.get('goals', {}).get(user_id, [])
     
     if not user_goals:
         return "You don't have any goals yet. Let's create one!"
     
-    result = f"📋 Your Goals ({len(user_goals)}):\n\n"
+    cached = get_cached_listing(tool_context, 'goals', ('goals',))
+    if cached is not None:
+        return cached
+    
+    parts = [f"📋 Your Goals ({len(user_goals)}):\n\n"]
     
     for goal in user_goals:
-        status_emoji = "✅" if goal.get('approved') else "⏳"
-        status_text = "Active" if goal.get('approved') else "Pending"
-        
-        result += f"{status_emoji} #{goal['id']}: **{goal['title']}** - {status_text}\n"
-        result += f"   {goal['description']}\n"
-        result += f"   {goal['frequency']} | Start: {goal['start_date']}\n\n"
+        parts.append(f"{goal['_status_emoji']} #{goal['id']}: **{goal['title']}** - {goal['_status_text']}\n")
+        parts.append(f"   {goal['description']}\n")
+        parts.append(f"   {goal['frequency']} | Start: {goal['start_date']}\n\n")
     
-    result += "\nUse 'show goal #ID' to see full details of any goal."
+    parts.append("\nUse 'show goal #ID' to see full details of any goal.")
     
-    return result
+    return cache_listing(tool_context, 'goals', ('goals',), "".join(parts))
 
 
 def update_goal_status(
@@ -193,32 +243,24 @@ def update_goal_status(
     Returns:
         Confirmation message
     """
-    user_id = tool_context.user_id
-    
-    if 'goals' not in tool_context.state:
+    goals = tool_context.state.get('goals')
+    if goals is None:
         return "❌ No goals found."
     
-    goals = tool_context.state['goals']
-    goal_found = False
+    goal = _find_goal(tool_context, goal_id)
     
-    for goal in goals:
-        if goal.get('id') == goal_id and goal.get('user_id') == user_id:
-            goal['status'] = status
-            goal['updated_at'] = datetime.now().isoformat()
-            goal_found = True
-            break
-    
-    if not goal_found:
+    if goal is None:
         return f"❌ Goal ID {goal_id} not found."
     
+    goal['status'] = status
+    goal['updated_at'] = now_iso(tool_context)
+    
     # Reassign to trigger state change
     tool_context.state['goals'] = goals
+    bump_version(tool_context, 'goals')
+    clear_tool_cache(tool_context)
     
-    status_messages = {
-        'completed': f"🎉 Congratulations! Goal '{goal['title']}' marked as completed!",
-        'paused': f"⏸️ Goal '{goal['title']}' paused. You can resume it anytime.",
-        'cancelled': f"🚫 Goal '{goal['title']}' cancelled.",
-        'active': f"✅ Goal '{goal['title']}' is now active!"
-    }
-    
-    return status_messages.get(status, f"✓ Goal status updated to: {status}")
+    template = _STATUS_TEMPLATES.get(status)
+    if template is None:
+        return f"✓ Goal status updated to: {status}"
+    return template.format(title=goal['title'])
@@ -3,15 +3,74 @@ Memory management tools for Personal Psychologist AI Agent
 Handles user memory, preferences, and therapeutic patterns
 """
 
+import copy
+import json
 import logging
-from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from google.adk.agents.callback_context import CallbackContext
 from google.adk.tools.tool_context import ToolContext
+from google.genai import types
+from .tool_cache import memoize_per_invocation, clear_tool_cache, now_iso
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Only the most recent history entries are kept; older ones are dropped on save
+MAX_HISTORY_ENTRIES = 500
 
+
+# Memory structure for a user seen for the first time (deep-copied, never mutated)
+_EMPTY_MEMORY_TEMPLATE = {
+    "personal_details": {},
+    "preferences": {},
+    "therapeutic_patterns": {
+        "triggers": {},  # Maps triggers to response history
+        "preferred_styles": [],
+        "avoided_styles": []
+    },
+    "history": [],
+    "interests": []
+}
+
+
+def _append_history(memory: Dict[str, Any], value: str) -> None:
+    # A plain list rather than a deque - session state must stay JSON-serializable
+    history = memory["history"]
+    history.append(value)
+    if len(history) > MAX_HISTORY_ENTRIES:
+        del history[:-MAX_HISTORY_ENTRIES]
+
+
+# save_to_memory keys that don't map to a top-level memory field of the same name
+_SAVERS = {
+    "name": lambda memory, value: memory["personal_details"].update(name=value),
+    "interests": lambda memory, value: memory["interests"].append(value),
+    "preferences": lambda memory, value: memory["preferences"].update(general=value),
+    "history": _append_history
+}
+
+
+def _ensure_user_memory(tool_context: ToolContext) -> Dict[str, Any]:
+    """Return the current user's memory, creating it from the template if needed."""
+    user_id = tool_context.user_id
+    memories = tool_context.state.get('user_memories', {})
+    memory = memories.get(user_id)
+    
+    if memory is None:
+        memory = copy.deepcopy(_EMPTY_MEMORY_TEMPLATE)
+        memories[user_id] = memory
+        tool_context.state['user_memories'] = memories
+        logger.info("Created new memory structure for user: %s", user_id)
+    
+    return memory
+
+
+def _norm(trigger: str) -> str:
+    """Canonical trigger key, shared by save_therapeutic_pattern and get_pattern."""
+    return trigger.lower().strip()
+
+
+@memoize_per_invocation
 def load_memory(tool_context: ToolContext) -> Dict[str, Any]:
     """Load comprehensive user memory including personal info, preferences, and therapeutic patterns.
     
@@ -23,30 +82,11 @@ def load_memory(tool_context: ToolContext) -> Dict[str, Any]:
         - history: interaction log
     """
     user_id = tool_context.user_id
-    logger.debug(f"Loading memory for user: {user_id}")
-    
-    if 'user_memories' not in tool_context.state:
-        tool_context.state['user_memories'] = {}
-        logger.debug("Initialized user_memories in state")
-    
-    if user_id not in tool_context.state['user_memories']:
-        tool_context.state['user_memories'][user_id] = {
-            "personal_details": {},
-            "preferences": {},
-            "therapeutic_patterns": {
-                "triggers": {},  # Maps triggers to response history
-                "preferred_styles": [],
-                "avoided_styles": []
-            },
-            "history": [],
-            "interests": []
-        }
-        logger.info(f"Created new memory structure for user: {user_id}")
-    else:
-        logger.debug(f"Memory found for user: {user_id}")
+    logger.debug("Loading memory for user: %s", user_id)
     
-    result = {"user_id": user_id, "memory": tool_context.state['user_memories'][user_id]}
-    logger.debug(f"Memory loaded with keys: {list(result['memory'].keys())}")
+    result = {"user_id": user_id, "memory": _ensure_user_memory(tool_context)}
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Memory loaded with keys: %s", list(result['memory'].keys()))
     return result
 
 
@@ -58,41 +98,22 @@ def save_to_memory(key: str, value: str, tool_context: ToolContext) -> str:
         value: Value to store
     """
     user_id = tool_context.user_id
-    logger.debug(f"Saving to memory - user: {user_id}, key: {key}, value: {value}")
-    
-    if 'user_memories' not in tool_context.state:
-        tool_context.state['user_memories'] = {}
-    
-    if user_id not in tool_context.state['user_memories']:
-        tool_context.state['user_memories'][user_id] = {
-            "personal_details": {},
-            "preferences": {},
-            "therapeutic_patterns": {"triggers": {}, "preferred_styles": [], "avoided_styles": []},
-            "history": [],
-            "interests": []
-        }
+    logger.debug("Saving to memory - user: %s, key: %s, value: %s", user_id, key, value)
     
-    memory = tool_context.state['user_memories'][user_id]
-    
-    if key == "name":
-        memory["personal_details"]["name"] = value
-    elif key == "interests":
-        interests = memory["interests"]
-        interests.append(value)
-        memory["interests"] = interests
-    elif key == "preferences":
-        memory["preferences"]["general"] = value
-    elif key == "history":
-        history = memory["history"]
-        history.append(value)
-        memory["history"] = history
+    memory = _ensure_user_memory(tool_context)
+    memories = tool_context.state['user_memories']
+    
+    saver = _SAVERS.get(key)
+    if saver is not None:
+        saver(memory, value)
     else:
         memory[key] = value
     
-    # Reassign to trigger state change
-    tool_context.state['user_memories'][user_id] = memory
+    # Reassign the top-level key - ADK only records a state delta on state[key] = value
+    tool_context.state['user_memories'] = memories
+    clear_tool_cache(tool_context)
     
-    logger.info(f"Successfully saved {key} to memory for user {user_id}")
+    logger.info("Successfully saved %s to memory for user %s", key, user_id)
     return f"✓ Saved {key} to memory"
 
 
@@ -110,36 +131,70 @@ def save_therapeutic_pattern(
         helpful: True if user found it helpful, False otherwise
     """
     user_id = tool_context.user_id
-    logger.debug(f"Saving therapeutic pattern - user: {user_id}, trigger: {trigger}, helpful: {helpful}")
-    
-    if 'user_memories' not in tool_context.state:
-        tool_context.state['user_memories'] = {}
-    
-    if user_id not in tool_context.state['user_memories']:
-        tool_context.state['user_memories'][user_id] = {
-            "personal_details": {},
-            "preferences": {},
-            "therapeutic_patterns": {"triggers": {}, "preferred_styles": [], "avoided_styles": []},
-            "history": [],
-            "interests": []
-        }
+    logger.debug("Saving therapeutic pattern - user: %s, trigger: %s, helpful: %s", user_id, trigger, helpful)
     
-    patterns = tool_context.state['user_memories'][user_id]["therapeutic_patterns"]
-    trigger_key = trigger.lower().strip()
+    patterns = _ensure_user_memory(tool_context)["therapeutic_patterns"]
+    memories = tool_context.state['user_memories']
+    trigger_key = _norm(trigger)
     
-    if trigger_key not in patterns["triggers"]:
-        patterns["triggers"][trigger_key] = {
+    pattern = patterns["triggers"].get(trigger_key)
+    if pattern is None:
+        pattern = patterns["triggers"][trigger_key] = {
             "helpful_responses": [],
-            "unhelpful_responses": []
+            "unhelpful_responses": [],
+            "latest_helpful": None,
+            "latest_unhelpful": None,
+            "helpful_count": 0,
+            "unhelpful_count": 0
         }
     
-    entry = {"response": response, "timestamp": datetime.now().isoformat()}
+    entry = {"response": response, "timestamp": now_iso(tool_context)}
+    kind = "helpful" if helpful else "unhelpful"
+    responses = pattern[f"{kind}_responses"]
+    responses.append(entry)
+    # Kept alongside the lists so readers get the newest response without scanning
+    pattern[f"latest_{kind}"] = entry
+    pattern[f"{kind}_count"] = len(responses)
+    
+    # Reassign the top-level key - ADK only records a state delta on state[key] = value
+    tool_context.state['user_memories'] = memories
+    clear_tool_cache(tool_context)
     
     if helpful:
-        patterns["triggers"][trigger_key]["helpful_responses"].append(entry)
-        logger.info(f"Marked response as HELPFUL for trigger '{trigger}' (user: {user_id})")
+        logger.info("Marked response as HELPFUL for trigger '%s' (user: %s)", trigger, user_id)
         return f"✓ Marked as helpful for '{trigger}'"
     else:
-        patterns["triggers"][trigger_key]["unhelpful_responses"].append(entry)
-        logger.info(f"Marked response as UNHELPFUL for trigger '{trigger}' (user: {user_id})")
+        logger.info("Marked response as UNHELPFUL for trigger '%s' (user: %s)", trigger, user_id)
         return f"✓ Marked as unhelpful for '{trigger}' - will try different approach next time"
+
+
+@memoize_per_invocation
+def get_pattern(trigger: str, tool_context: ToolContext) -> Dict[str, Any]:
+    """Look up what has and hasn't helped for one emotional trigger.
+    
+    Args:
+        trigger: Emotional trigger (e.g., "overwhelmed", "stressed")
+    
+    Returns:
+        The trigger's helpful and unhelpful responses, or None if nothing is recorded yet
+    """
+    user_id = tool_context.user_id
+    memory = tool_context.state.get('user_memories', {}).get(user_id)
+    trigger_key = _norm(trigger)
+    
+    pattern = memory["therapeutic_patterns"]["triggers"].get(trigger_key) if memory else None
+    logger.debug("Pattern lookup - user: %s, trigger: %s, found: %s", user_id, trigger_key, pattern is not None)
+    return {"trigger": trigger_key, "pattern": pattern}
+
+
+def preload_memory_snapshot(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Load user memory into state before the agent runs.
+    
+    Stores the memory as text under 'temp:memory_snapshot' so instructions can
+    inject it with {temp:memory_snapshot} instead of calling load_memory().
+    temp: state lasts for the current invocation only and is never persisted.
+    """
+    memory = load_memory(tool_context=callback_context)["memory"]
+    callback_context.state['temp:memory_snapshot'] = json.dumps(memory, ensure_ascii=False)
+    logger.debug("Memory snapshot built")
+    return None
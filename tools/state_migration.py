@@ -0,0 +1,62 @@
+"""
+State migration for Personal Psychologist AI Agent
+Converts sessions saved with the original flat task, reminder and goal lists
+"""
+
+import logging
+import uuid
+from typing import Optional
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+from .goal_tools import _STATUS_DISPLAY, _goal_key
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# Each collection and the per-user counter its IDs come from
+_COLLECTIONS = {
+    'tasks': 'next_task_id',
+    'reminders': 'next_reminder_id',
+    'goals': 'next_goal_id'
+}
+
+
+def migrate_flat_lists(callback_context: CallbackContext) -> Optional[types.Content]:
+    """Convert flat collection lists to the per-user layout before the agent runs.
+
+    The original tools kept each collection as one list shared by every user;
+    the current ones read state[collection][user_id] -> list. A converted
+    collection is a dict, so this only does work once per session.
+    """
+    state = callback_context.state
+
+    for collection, counter in _COLLECTIONS.items():
+        items = state.get(collection)
+        if not isinstance(items, list):
+            continue
+
+        partitioned = {}
+        for item in items:
+            partitioned.setdefault(item.get('user_id'), []).append(item)
+
+        if collection == 'goals':
+            for user_goals in partitioned.values():
+                for goal in user_goals:
+                    goal.update(_STATUS_DISPLAY[bool(goal.get('approved'))])
+            state['goal_index'] = {
+                _goal_key(user_id, goal['id']): i
+                for user_id, user_goals in partitioned.items()
+                for i, goal in enumerate(user_goals)
+            }
+
+        state[collection] = partitioned
+        # Old IDs were numbered across all users, so continue after the largest
+        state[counter] = {
+            user_id: max(item['id'] for item in user_items)
+            for user_id, user_items in partitioned.items()
+        }
+        # New versions so listings cached for the empty collection re-render
+        state[f'{collection}_version'] = {user_id: uuid.uuid4().hex for user_id in partitioned}
+        logger.info("Migrated %d %s to the per-user layout", len(items), collection)
+
+    return None
@@ -4,13 +4,37 @@ Handles tasks, reminders, and scheduling
 """
 
 import logging
-from datetime import datetime
+from typing import Any, Dict, Iterator, List
 from google.adk.tools.tool_context import ToolContext
+from .tool_cache import (
+    memoize_per_invocation,
+    clear_tool_cache,
+    bump_version,
+    get_cached_listing,
+    cache_listing,
+    next_id,
+    now_iso
+)
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
 
+def _task_lines(user_tasks: List[Dict[str, Any]]) -> Iterator[str]:
+    for task in user_tasks:
+        # Read each field once
+        title = task.get('title')
+        due_date = task.get('due_date')
+        priority = task.get('priority', 'medium')
+        due_info = f" (due: {due_date})" if due_date else ""
+        yield f"\n• {title} - Priority: {priority}{due_info}"
+
+
+def _reminder_lines(user_reminders: List[Dict[str, Any]]) -> Iterator[str]:
+    for reminder in user_reminders:
+        yield f"\n• {reminder.get('title')} - {reminder.get('date')} at {reminder.get('time')}"
+
+
 def create_task(
     title: str,
     tool_context: ToolContext,
@@ -25,33 +49,34 @@ def create_task(
         priority: low, medium, or high
     """
     user_id = tool_context.user_id
-    logger.debug(f"Creating task for user {user_id}: {title}")
+    logger.debug("Creating task for user %s: %s", user_id, title)
     
-    if 'tasks' not in tool_context.state:
-        tool_context.state['tasks'] = []
-        logger.debug("Initialized tasks list in state")
+    # Tasks are partitioned per user: state['tasks'][user_id] -> list
+    tasks = tool_context.state.setdefault('tasks', {})
+    user_tasks = tasks.setdefault(user_id, [])
     
     task = {
-        "id": len(tool_context.state['tasks']) + 1,
+        "id": next_id(tool_context, 'next_task_id'),
         "user_id": user_id,
         "title": title,
         "due_date": due_date,
         "priority": priority,
         "completed": False,
-        "created_at": datetime.now().isoformat()
+        "created_at": now_iso(tool_context)
     }
     
-    # CRITICAL: Create new list to trigger state delta tracking
-    tasks = tool_context.state['tasks']
-    tasks.append(task)
+    user_tasks.append(task)
     tool_context.state['tasks'] = tasks  # Reassign to trigger state change
+    bump_version(tool_context, 'tasks')
+    clear_tool_cache(tool_context)
     
-    logger.info(f"Task created (id: {task['id']}) for user {user_id}: {title}")
-    logger.debug(f"Total tasks in state: {len(tool_context.state['tasks'])}")
+    logger.info("Task created (id: %s) for user %s: %s", task['id'], user_id, title)
+    logger.debug("Total tasks for user: %d", len(user_tasks))
     
     return f"✓ Task created: {title}" + (f" (due: {due_date})" if due_date else "")
 
 
+@memoize_per_invocation
 def get_tasks(tool_context: ToolContext) -> str:
     """Get all tasks for the current user.
     
@@ -59,26 +84,23 @@ def get_tasks(tool_context: ToolContext) -> str:
         Formatted string listing all tasks, or message if no tasks exist.
     """
     user_id = tool_context.user_id
-    logger.debug(f"Retrieving tasks for user: {user_id}")
-    
-    if 'tasks' not in tool_context.state:
-        tool_context.state['tasks'] = []
+    logger.debug("Retrieving tasks for user: %s", user_id)
     
-    user_tasks = [t for t in tool_context.state['tasks'] if t.get("user_id") == user_id]
+    user_tasks = tool_context.state.get('tasks', {}).get(user_id, [])
     
-    logger.info(f"Found {len(user_tasks)} tasks for user {user_id}")
-    logger.debug(f"Total tasks in state: {len(tool_context.state['tasks'])}")
+    logger.info("Found %d tasks for user %s", len(user_tasks), user_id)
     
     if not user_tasks:
         return "You have no tasks."
     
-    result = f"You have {len(user_tasks)} task(s):\n"
-    for task in user_tasks:
-        due_info = f" (due: {task.get('due_date')})" if task.get('due_date') else ""
-        priority = task.get('priority', 'medium')
-        result += f"\n• {task.get('title')} - Priority: {priority}{due_info}"
+    cached = get_cached_listing(tool_context, 'tasks', ('tasks',))
+    if cached is not None:
+        return cached
     
-    return result
+    parts = [f"You have {len(user_tasks)} task(s):\n"]
+    parts.extend(_task_lines(user_tasks))
+    
+    return cache_listing(tool_context, 'tasks', ('tasks',), "".join(parts))
 
 
 def schedule_reminder(
@@ -95,32 +117,33 @@ def schedule_reminder(
         time: Time (HH:MM)
     """
     user_id = tool_context.user_id
-    logger.debug(f"Scheduling reminder for user {user_id}: {title} at {date} {time}")
+    logger.debug("Scheduling reminder for user %s: %s at %s %s", user_id, title, date, time)
     
-    if 'reminders' not in tool_context.state:
-        tool_context.state['reminders'] = []
-        logger.debug("Initialized reminders list in state")
+    # Reminders are partitioned per user: state['reminders'][user_id] -> list
+    reminders = tool_context.state.setdefault('reminders', {})
+    user_reminders = reminders.setdefault(user_id, [])
     
     reminder = {
-        "id": len(tool_context.state['reminders']) + 1,
+        "id": next_id(tool_context, 'next_reminder_id'),
         "user_id": user_id,
         "title": title,
         "date": date,
         "time": time,
-        "created_at": datetime.now().isoformat()
+        "created_at": now_iso(tool_context)
     }
     
-    # CRITICAL: Create new list to trigger state delta tracking
-    reminders = tool_context.state['reminders']
-    reminders.append(reminder)
+    user_reminders.append(reminder)
     tool_context.state['reminders'] = reminders  # Reassign to trigger state change
+    bump_version(tool_context, 'reminders')
+    clear_tool_cache(tool_context)
     
-    logger.info(f"Reminder set (id: {reminder['id']}) for user {user_id}: {title} at {date} {time}")
-    logger.debug(f"Total reminders in state: {len(tool_context.state['reminders'])}")
+    logger.info("Reminder set (id: %s) for user %s: %s at %s %s", reminder['id'], user_id, title, date, time)
+    logger.debug("Total reminders for user: %d", len(user_reminders))
     
     return f"✓ Reminder set: {title} on {date} at {time}"
 
 
+@memoize_per_invocation
 def get_reminders(tool_context: ToolContext) -> str:
     """Get all reminders for the current user.
     
@@ -129,26 +152,24 @@ def get_reminders(tool_context: ToolContext) -> str:
     """
     user_id = tool_context.user_id
     
-    if 'reminders' not in tool_context.state:
-        tool_context.state['reminders'] = []
-    
-    user_reminders = [r for r in tool_context.state['reminders'] if r.get("user_id") == user_id]
+    user_reminders = tool_context.state.get('reminders', {}).get(user_id, [])
     
-    # Debug logging
-    print(f"📅 Reminders for user {user_id}: {len(user_reminders)} reminders")
-    print(f"📊 Total reminders in state: {len(tool_context.state['reminders'])}")
+    logger.debug("Reminders for user %s: %d", user_id, len(user_reminders))
     
     if not user_reminders:
         return "You have no reminders scheduled."
     
-    result = f"You have {len(user_reminders)} reminder(s):\n"
-    for reminder in user_reminders:
-        result += f"\n• {reminder.get('title')} - {reminder.get('date')} at {reminder.get('time')}"
-        print(f"  - {reminder.get('title')} on {reminder.get('date')} at {reminder.get('time')}")
+    cached = get_cached_listing(tool_context, 'reminders', ('reminders',))
+    if cached is not None:
+        return cached
+    
+    parts = [f"You have {len(user_reminders)} reminder(s):\n"]
+    parts.extend(_reminder_lines(user_reminders))
     
-    return result
+    return cache_listing(tool_context, 'reminders', ('reminders',), "".join(parts))
 
 
+@memoize_per_invocation
 def get_all_items(tool_context: ToolContext) -> str:
     """Get all tasks and reminders for the current user.
     
@@ -157,34 +178,26 @@ def get_all_items(tool_context: ToolContext) -> str:
     """
     user_id = tool_context.user_id
     
-    # Get tasks
-    if 'tasks' not in tool_context.state:
-        tool_context.state['tasks'] = []
-    user_tasks = [t for t in tool_context.state['tasks'] if t.get("user_id") == user_id]
+    user_tasks = tool_context.state.get('tasks', {}).get(user_id, [])
+    user_reminders = tool_context.state.get('reminders', {}).get(user_id, [])
     
-    # Get reminders
-    if 'reminders' not in tool_context.state:
-        tool_context.state['reminders'] = []
-    user_reminders = [r for r in tool_context.state['reminders'] if r.get("user_id") == user_id]
-    
-    # Debug logging
-    print(f"📊 All items for user {user_id}: {len(user_tasks)} tasks, {len(user_reminders)} reminders")
+    logger.debug("All items for user %s: %d tasks, %d reminders", user_id, len(user_tasks), len(user_reminders))
     
     if not user_tasks and not user_reminders:
         return "You have no tasks or reminders."
     
-    result = ""
+    cached = get_cached_listing(tool_context, 'all_items', ('tasks', 'reminders'))
+    if cached is not None:
+        return cached
+    
+    parts = []
     
     if user_tasks:
-        result += f"\n📋 **Tasks** ({len(user_tasks)}):\n"
-        for task in user_tasks:
-            due_info = f" (due: {task.get('due_date')})" if task.get('due_date') else ""
-            priority = task.get('priority', 'medium')
-            result += f"\n• {task.get('title')} - Priority: {priority}{due_info}"
+        parts.append(f"\n📋 **Tasks** ({len(user_tasks)}):\n")
+        parts.extend(_task_lines(user_tasks))
     
     if user_reminders:
-        result += f"\n\n📅 **Reminders** ({len(user_reminders)}):\n"
-        for reminder in user_reminders:
-            result += f"\n• {reminder.get('title')} - {reminder.get('date')} at {reminder.get('time')}"
+        parts.append(f"\n\n📅 **Reminders** ({len(user_reminders)}):\n")
+        parts.extend(_reminder_lines(user_reminders))
     
-    return result.strip()
+    return cache_listing(tool_context, 'all_items', ('tasks', 'reminders'), "".join(parts).strip())
@@ -0,0 +1,125 @@
+"""
+Tool result caches for Personal Psychologist AI Agent
+Per-invocation results shared by co-resident agents, versioned rendered listings,
+per-user ID counters and a turn-scoped timestamp
+"""
+
+import functools
+import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# temp: state lives for one invocation and is never persisted, so these
+# are dropped automatically when the turn ends
+TOOL_CACHE_KEY = 'temp:tool_cache'
+TURN_TIMESTAMP_KEY = 'temp:now'
+
+# Rendered listings kept in process, least recently used first
+MAX_CACHED_LISTINGS = 256
+
+# Maps (user_id, listing name, collection versions) -> rendered listing
+_rendered_listings: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+
+
+def memoize_per_invocation(func: Callable) -> Callable:
+    """Reuse a read-only tool's result for identical calls in the same invocation.
+
+    The wrapper keeps the tool's signature (via functools.wraps), so ADK
+    still builds the same function declaration for it.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, tool_context, **kwargs):
+        results = tool_context.state.setdefault(TOOL_CACHE_KEY, {})
+
+        key = f"{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+        if key in results:
+            logger.debug("Tool cache hit: %s", func.__name__)
+            return results[key]
+
+        result = func(*args, tool_context=tool_context, **kwargs)
+        results[key] = result
+        return result
+
+    return wrapper
+
+
+def clear_tool_cache(tool_context) -> None:
+    """Drop cached results for this invocation; call from tools that write state."""
+    tool_context.state[TOOL_CACHE_KEY] = {}
+
+
+# ============================================================
+# RENDERED LISTING CACHE
+# Listings are cached in process, tagged with the versions of the
+# collections they were built from; only the versions live in state
+# ============================================================
+
+def bump_version(tool_context, collection: str) -> None:
+    """Mark the current user's collection as changed so its listings re-render.
+    
+    Versions are random tokens rather than counters, so equal versions mean
+    equal data even across sessions and workers.
+    """
+    user_id = tool_context.user_id
+    versions = tool_context.state.get(f'{collection}_version', {})
+    versions[user_id] = uuid.uuid4().hex
+    tool_context.state[f'{collection}_version'] = versions
+
+
+def _listing_key(tool_context, name: str, collections: Tuple[str, ...]) -> Tuple[Any, ...]:
+    # Every write bumps its collection, so a missing version (None) means the
+    # collection was never written in this session and is empty
+    user_id = tool_context.user_id
+    versions = tuple(tool_context.state.get(f'{c}_version', {}).get(user_id) for c in collections)
+    return (user_id, name, versions)
+
+
+def get_cached_listing(tool_context, name: str, collections: Tuple[str, ...]) -> Optional[str]:
+    """Return the cached listing if none of its collections changed since it was built."""
+    key = _listing_key(tool_context, name, collections)
+    cached = _rendered_listings.get(key)
+    if cached is None:
+        return None
+    _rendered_listings.move_to_end(key)
+    logger.debug("Listing cache hit: %s", name)
+    return cached
+
+
+def cache_listing(tool_context, name: str, collections: Tuple[str, ...], result: str) -> str:
+    """Store a rendered listing for the current user and return it."""
+    _rendered_listings[_listing_key(tool_context, name, collections)] = result
+    if len(_rendered_listings) > MAX_CACHED_LISTINGS:
+        _rendered_listings.popitem(last=False)
+    return result
+
+
+# ============================================================
+# ID COUNTERS
+# ============================================================
+
+def next_id(tool_context, counter: str) -> int:
+    """Allocate the current user's next ID from a per-user counter in state."""
+    counters = tool_context.state.get(counter, {})
+    new_id = counters[tool_context.user_id] = counters.get(tool_context.user_id, 0) + 1
+    tool_context.state[counter] = counters
+    return new_id
+
+
+# ============================================================
+# TURN TIMESTAMP
+# ============================================================
+
+def now_iso(tool_context) -> str:
+    """Current time as an ISO string, shared by every tool call in the invocation.
+    
+    ADK builds a new ToolContext per call, so the timestamp is kept in temp: state.
+    """
+    timestamp = tool_context.state.get(TURN_TIMESTAMP_KEY)
+    if timestamp is None:
+        timestamp = tool_context.state[TURN_TIMESTAMP_KEY] = datetime.now().isoformat()
+    return timestamp